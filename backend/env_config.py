@@ -4,75 +4,76 @@ Allows overriding config.yaml settings with environment variables.
 """
 
 import os
+import copy
 import logging
+import functools
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
 
-def str_to_bool(value: str) -> bool:
-    """Convert string to boolean."""
-    return value.lower() in ('true', '1', 'yes', 'on')
+# Lowercased strings treated as true by str_to_bool
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
 
 
+def str_to_bool(value: str) -> bool:
+    """Convert string to boolean."""
+    return value.lower() in _TRUTHY
+
+
+# Environment variable -> (git_config key, converter). Variables with a
+# converter are applied whenever set; plain strings only when non-empty.
+_GIT_ENV_MAPPING = (
+    ('GIT_ENABLED', ('enabled', str_to_bool)),
+    ('GIT_REPO_URL', ('repo_url', None)),
+    ('GIT_BRANCH', ('branch', None)),
+    ('GIT_VALUES_PATH', ('values_path', None)),
+    ('GIT_LOCAL_PATH', ('local_path', None)),
+    ('GIT_AUTHOR_NAME', ('author_name', None)),
+    ('GIT_AUTHOR_EMAIL', ('author_email', None)),
+    ('GIT_AUTO_PULL_ON_START', ('auto_pull_on_start', str_to_bool)),
+    ('GIT_AUTO_PUSH_ON_UPDATE', ('auto_push_on_update', str_to_bool)),
+    ('GIT_COMMIT_MESSAGE_TEMPLATE', ('commit_message_template', None)),
+)
+
+# Environment variable -> (git_config['auth'] key, converter)
+_GIT_AUTH_ENV_MAPPING = (
+    ('GIT_AUTH_METHOD', ('method', None)),
+    ('GIT_SSH_KEY_PATH', ('ssh_key_path', None)),
+    ('GIT_TOKEN', ('token', None)),
+)
+
+
+@functools.lru_cache(maxsize=1)
 def load_git_config_from_env() -> Dict[str, Any]:
     """
     Load Git configuration from environment variables.
     Environment variables take precedence over config.yaml.
-    """
-    git_config = {}
-
-    # Basic Git settings
-    if os.getenv('GIT_ENABLED') is not None:
-        git_config['enabled'] = str_to_bool(os.getenv('GIT_ENABLED'))
-
-    if os.getenv('GIT_REPO_URL'):
-        git_config['repo_url'] = os.getenv('GIT_REPO_URL')
-
-    if os.getenv('GIT_BRANCH'):
-        git_config['branch'] = os.getenv('GIT_BRANCH')
-
-    if os.getenv('GIT_VALUES_PATH'):
-        git_config['values_path'] = os.getenv('GIT_VALUES_PATH')
-
-    if os.getenv('GIT_LOCAL_PATH'):
-        git_config['local_path'] = os.getenv('GIT_LOCAL_PATH')
-
-    if os.getenv('GIT_AUTHOR_NAME'):
-        git_config['author_name'] = os.getenv('GIT_AUTHOR_NAME')
-
-    if os.getenv('GIT_AUTHOR_EMAIL'):
-        git_config['author_email'] = os.getenv('GIT_AUTHOR_EMAIL')
-
-    # Auto-sync options
-    if os.getenv('GIT_AUTO_PULL_ON_START') is not None:
-        git_config['auto_pull_on_start'] = str_to_bool(os.getenv('GIT_AUTO_PULL_ON_START'))
 
-    if os.getenv('GIT_AUTO_PUSH_ON_UPDATE') is not None:
-        git_config['auto_push_on_update'] = str_to_bool(os.getenv('GIT_AUTO_PUSH_ON_UPDATE'))
+    The environment does not change mid-process, so the result is computed
+    once and reused; call ``load_git_config_from_env.cache_clear()`` to reset.
+    """
+    git_config = _apply_env_mapping(_GIT_ENV_MAPPING)
 
     # Authentication settings
-    auth_config = {}
-
-    if os.getenv('GIT_AUTH_METHOD'):
-        auth_config['method'] = os.getenv('GIT_AUTH_METHOD')
-
-    if os.getenv('GIT_SSH_KEY_PATH'):
-        auth_config['ssh_key_path'] = os.getenv('GIT_SSH_KEY_PATH')
-
-    if os.getenv('GIT_TOKEN'):
-        auth_config['token'] = os.getenv('GIT_TOKEN')
-
+    auth_config = _apply_env_mapping(_GIT_AUTH_ENV_MAPPING)
     if auth_config:
         git_config['auth'] = auth_config
 
-    # Commit message template
-    if os.getenv('GIT_COMMIT_MESSAGE_TEMPLATE'):
-        git_config['commit_message_template'] = os.getenv('GIT_COMMIT_MESSAGE_TEMPLATE')
-
     return git_config
 
 
+def _apply_env_mapping(mapping) -> Dict[str, Any]:
+    """Build a config dict from an (env var, (key, converter)) mapping table."""
+    env = os.environ.get
+    result = {}
+    for env_var, (key, converter) in mapping:
+        value = env(env_var)
+        if value is not None and (converter or value):
+            result[key] = converter(value) if converter else value
+    return result
+
+
 def merge_configs(file_config: Dict[str, Any], env_overrides: Dict[str, Any]) -> Dict[str, Any]:
     """
     Merge file configuration with environment variable overrides.
@@ -85,17 +86,23 @@ def merge_configs(file_config: Dict[str, Any], env_overrides: Dict[str, Any]) ->
     Returns:
         Merged configuration dictionary
     """
-    merged = file_config.copy()
+    merged = copy.deepcopy(file_config)
+    _deep_merge(merged, env_overrides)
+    return merged
 
-    for key, value in env_overrides.items():
-        if isinstance(value, dict) and key in merged and isinstance(merged[key], dict):
+
+def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """Recursively merge src into dst in place, creating nested dicts as needed."""
+    for key, value in src.items():
+        if isinstance(value, dict):
             # Merge nested dictionaries
-            merged[key] = {**merged[key], **value}
+            node = dst.get(key)
+            if not isinstance(node, dict):
+                node = dst[key] = {}
+            _deep_merge(node, value)
         else:
             # Override with env value
-            merged[key] = value
-
-    return merged
+            dst[key] = value
 
 
 def load_config_with_env(file_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -4,15 +4,19 @@ Handles Git operations: clone, pull, commit, push
 """
 
 import os
+import filecmp
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from git import Repo, GitCommandError, Actor
 from git.exc import InvalidGitRepositoryError, NoSuchPathError
 
 logger = logging.getLogger(__name__)
 
+# Format for the {timestamp} placeholder in commit messages
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 class GitHelper:
     """Helper class for Git operations."""
@@ -48,12 +52,24 @@ class GitHelper:
 
         self.repo: Optional[Repo] = None
 
+        # Auth URL and Git environment don't change after init, so build them once
+        self._auth_url = self._compute_auth_url()
+        self._git_env = self._compute_git_env()
+
     def is_enabled(self) -> bool:
         """Check if Git integration is enabled."""
         return self.enabled and bool(self.repo_url)
 
     def get_auth_url(self) -> str:
         """Get repository URL with authentication if using token."""
+        return self._auth_url
+
+    def get_git_env(self) -> Dict[str, str]:
+        """Get environment variables for Git operations."""
+        return self._git_env
+
+    def _compute_auth_url(self) -> str:
+        """Build the repository URL, inserting the token if using token auth."""
         if self.auth_method == "token" and self.token:
             # Insert token into HTTPS URL
             if self.repo_url.startswith("https://"):
@@ -61,8 +77,8 @@ class GitHelper:
                 return self.repo_url.replace("https://", f"https://{self.token}@")
         return self.repo_url
 
-    def get_git_env(self) -> Dict[str, str]:
-        """Get environment variables for Git operations."""
+    def _compute_git_env(self) -> Dict[str, str]:
+        """Build the environment variables for Git operations."""
         env = os.environ.copy()
 
         # Set SSH key if using SSH auth
@@ -93,6 +109,11 @@ class GitHelper:
                     self.repo = Repo(self.local_path)
                     logger.info(f"Using existing repository at {self.local_path}")
 
+                    # Point origin at the authenticated URL once, rather than on every pull/push
+                    if self.auth_method == "token" and self.token:
+                        self.repo.remotes.origin.set_url(self.get_auth_url())
+                        logger.info("Updated remote URL with authentication")
+
                     # Ensure we're on the correct branch
                     if self.repo.active_branch.name != self.branch:
                         logger.info(f"Switching to branch {self.branch}")
@@ -120,6 +141,7 @@ class GitHelper:
                 auth_url, self.local_path, branch=self.branch, env=env
             )
 
+            # Cloning from the auth URL already leaves origin pointing at it
             logger.info("Repository cloned successfully")
             return True
 
@@ -143,11 +165,6 @@ class GitHelper:
 
             origin = self.repo.remotes.origin
 
-            # Update remote URL with auth credentials if using token
-            if self.auth_method == "token" and self.token:
-                auth_url = self.get_auth_url()
-                origin.set_url(auth_url)
-
             origin.pull(self.branch, env=env)
 
             logger.info("Pull completed successfully")
@@ -178,8 +195,9 @@ class GitHelper:
             return {"success": False, "message": "Repository not initialized"}
 
         try:
-            # Check if there are changes to commit
-            if not self.repo.is_dirty(untracked_files=True):
+            # Check if there are changes to commit - only the values file is
+            # staged, so there's no need to scan the rest of the working tree
+            if not self.repo.is_dirty(untracked_files=True, path=self.values_path):
                 logger.info("No changes to commit")
                 return {"success": True, "message": "No changes to commit"}
 
@@ -189,7 +207,7 @@ class GitHelper:
 
             # Generate commit message
             if not message:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
                 message = self.commit_message_template.format(
                     timestamp=timestamp, user="Helm UI"
                 )
@@ -208,12 +226,6 @@ class GitHelper:
                     env = self.get_git_env()
                     origin = self.repo.remotes.origin
 
-                    # Update remote URL with auth credentials if using token
-                    if self.auth_method == "token" and self.token:
-                        auth_url = self.get_auth_url()
-                        origin.set_url(auth_url)
-                        logger.info("Updated remote URL with authentication")
-
                     logger.info(f"Attempting to push to remote repository")
                     logger.info(f"Current branch: {self.repo.active_branch.name}")
                     logger.info(f"Using auth method: {self.auth_method}")
@@ -279,6 +291,12 @@ class GitHelper:
             }
 
         try:
+            # One working tree scan instead of separate is_dirty/untracked/diff walks
+            raw_status = self.repo.git.status(
+                porcelain="v1", z=True, untracked_files="all"
+            )
+            modified_files, untracked_files = self._parse_porcelain_status(raw_status)
+
             status = {
                 "enabled": True,
                 "initialized": True,
@@ -291,9 +309,9 @@ class GitHelper:
                     "author": str(self.repo.head.commit.author),
                     "date": self.repo.head.commit.committed_datetime.isoformat(),
                 },
-                "has_changes": self.repo.is_dirty(untracked_files=True),
-                "untracked_files": self.repo.untracked_files,
-                "modified_files": [item.a_path for item in self.repo.index.diff(None)],
+                "has_changes": bool(raw_status),
+                "untracked_files": untracked_files,
+                "modified_files": modified_files,
             }
 
             return status
@@ -302,6 +320,37 @@ class GitHelper:
             logger.error(f"Error getting repository status: {str(e)}")
             return {"enabled": True, "initialized": True, "error": str(e)}
 
+    @staticmethod
+    def _parse_porcelain_status(raw_status: str) -> Tuple[List[str], List[str]]:
+        """
+        Parse ``git status --porcelain=v1 -z`` output.
+
+        Returns:
+            Tuple of (files modified in the working tree, untracked files)
+        """
+        modified_files: List[str] = []
+        untracked_files: List[str] = []
+
+        entries = iter(raw_status.split("\0"))
+        for entry in entries:
+            if not entry:
+                continue
+
+            code, path = entry[:2], entry[3:]
+            if code == "??":
+                untracked_files.append(path)
+                continue
+
+            # Unstaged change in the working tree (same as index.diff(None))
+            if code[1] != " ":
+                modified_files.append(path)
+
+            # Renames and copies are followed by their original path
+            if "R" in code or "C" in code:
+                next(entries, None)
+
+        return modified_files, untracked_files
+
     def get_values_file_path(self) -> str:
         """Get the full path to the values.yaml file in the repository."""
         if self.repo:
@@ -323,6 +372,16 @@ class GitHelper:
 
         try:
             target_path = self.get_values_file_path()
+
+            # Skip the copy when the target already has identical content
+            if (
+                os.path.exists(target_path)
+                and os.path.getsize(source_path) == os.path.getsize(target_path)
+                and filecmp.cmp(source_path, target_path, shallow=False)
+            ):
+                logger.info(f"Values file at {target_path} already up to date")
+                return True
+
             import shutil
 
             shutil.copy2(source_path, target_path)
@@ -1,5 +1,14 @@
+import asyncio
+import copy
+from contextlib import asynccontextmanager
 import enum
+import errno
+import functools
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+import orjson
 import yaml
 import json
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,12 +17,34 @@ from typing import Dict, Any, Optional
 import logging
 import os
 import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from git_helper import GitHelper
 from env_config import load_config_with_env
 
+# Prefer the LibYAML-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the Git repository, then warm the caches from the final VALUES_FILE."""
+    # Both are defined further down and block (Git clone/pull, file parsing),
+    # so run them off the event loop
+    await run_in_threadpool(init_git_repository)
+    await run_in_threadpool(_warm_caches)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,13 +62,37 @@ class UpdateRequest(BaseModel):
     data: Dict[str, Any]
 
 
+def _json_default(obj):
+    """Encode the YAML types orjson doesn't handle natively (!!set, !!binary)."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    raise TypeError
+
+
+def _dumps_json(content):
+    """Serialize content to JSON bytes with orjson, much faster than stdlib json."""
+    try:
+        # YAML allows non-string keys (e.g. ports), which orjson rejects by default
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits: fall back to FastAPI's own encoding
+        return json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
 def load_config():
     """Load configuration from config.yaml and merge with environment variables."""
     try:
         file_config = {}
         if os.path.exists(CONFIG_FILE):
             with open(CONFIG_FILE, "r") as file:
-                file_config = yaml.safe_load(file) or {}
+                file_config = yaml.load(file.read(), Loader=_Loader) or {}
         else:
             logging.warning(f"Config file {CONFIG_FILE} not found. Using defaults with environment variable overrides.")
             file_config = {
@@ -65,21 +120,44 @@ def load_config():
         }
 
 
+def apply_config(new_config):
+    """Set the module-level settings derived from a loaded configuration."""
+    global config, _config_json, readonly_fields, enum_fields, field_titles, field_descriptions, sections_config, ui_config
+
+    # Build everything first so a failure leaves the previous settings intact
+    # Serialized once here since /config only changes on reload
+    new_config_json = _dumps_json(new_config)
+    # Frozensets give O(1) membership checks during schema generation and updates
+    new_readonly_fields = frozenset(new_config.get("readonly_fields") or [])
+    new_enum_fields = frozenset(new_config.get("enum_fields") or [])
+
+    config = new_config
+    _config_json = new_config_json
+    readonly_fields = new_readonly_fields
+    enum_fields = new_enum_fields
+    field_titles = config.get("field_titles", {})
+    field_descriptions = config.get("field_descriptions", {})
+    sections_config = config.get("sections", [])
+    ui_config = config.get("ui_config", {})
+
+
 # Load configuration at startup
-config = load_config()
-readonly_fields = config.get("readonly_fields", [])
-enum_fields = config.get("enum_fields", [])
-field_titles = config.get("field_titles", {})
-field_descriptions = config.get("field_descriptions", {})
-sections_config = config.get("sections", [])
-ui_config = config.get("ui_config", {})
+apply_config(load_config())
 
 # Initialize Git helper
 git_config = config.get("git_config", {})
 git_helper = GitHelper(git_config)
 
-# Initialize Git repository if enabled
-if git_helper.is_enabled():
+
+# Initialize Git repository if enabled. Done at server startup (see lifespan)
+# rather than import time so importing this module doesn't trigger a clone or pull.
+def init_git_repository():
+    """Clone or open the Git repository and point VALUES_FILE at it."""
+    global VALUES_FILE
+
+    if not git_helper.is_enabled():
+        return
+
     logging.info("Git integration is enabled. Initializing repository...")
     if git_helper.init_repository():
         logging.info("Git repository initialized successfully")
@@ -97,14 +175,156 @@ if git_helper.is_enabled():
 
 def get_values_file() -> str:
     """Get the path to the values.yaml file (Git or local)."""
-    if git_helper.is_enabled() and git_helper.get_values_file_path():
-        return git_helper.get_values_file_path()
-    return "../values.yaml"
+    git_values_path = git_helper.get_values_file_path() if git_helper.is_enabled() else ""
+    return git_values_path or "../values.yaml"
+
+
+# Parsed YAML files: path -> (mtime_ns, size, data), least recently used first
+_yaml_cache = OrderedDict()
+_YAML_CACHE_SIZE = 100
+_yaml_cache_lock = threading.Lock()
+
+# Serialized schemas keyed on values.yaml's (mtime_ns, size) and the config
+# version; oldest evicted first
+_schema_cache = {}
+_SCHEMA_CACHE_SIZE = 4
+_schema_cache_lock = threading.Lock()
+
+# Bumped whenever the config is reloaded, since schema metadata depends on it
+_config_version = 0
+
+
+def load_yaml_cached(path):
+    """
+    Return the parsed contents of a YAML file, re-reading it only when its
+    mtime or size has changed. Callers must not mutate the returned data.
+    """
+    stat = os.stat(path)
+    with _yaml_cache_lock:
+        entry = _yaml_cache.get(path)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            _yaml_cache.move_to_end(path)
+            return entry[2]
+
+    with open(path, "r") as file:
+        data = yaml.load(file.read(), Loader=_Loader) or {}
+    _store_yaml_cached(path, stat, data)
+    return data
+
+
+def _store_yaml_cached(path, stat, data):
+    """Record parsed data for path against the given os.stat result."""
+    with _yaml_cache_lock:
+        _yaml_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+        _yaml_cache.move_to_end(path)
+        while len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+
+
+def _load_values():
+    """Return parsed values.yaml from the YAML cache."""
+    return load_yaml_cached(VALUES_FILE)
+
+
+# Minimum seconds between Git pulls triggered by /schema polling
+_PULL_TTL = 5.0
+_last_pull_ts = 0.0
+_pull_lock = threading.Lock()
+
+def _write_values_file(content):
+    """
+    Atomically replace values.yaml with content, keeping its permissions.
+
+    Returns:
+        os.stat result for the written file
+    """
+    # Write next to the real file so a symlinked values.yaml stays a symlink
+    target = os.path.realpath(VALUES_FILE)
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".values-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(content)
+        shutil.copymode(target, tmp_file)
+
+        # Stat before the swap (rename keeps mtime and size): a Git pull landing
+        # right after os.replace must not be recorded against our values
+        stat = os.stat(tmp_file)
+        try:
+            os.replace(tmp_file, target)
+        except OSError as e:
+            if e.errno != errno.EBUSY:
+                raise
+            # A bind-mounted single file can't be renamed over; write it in place
+            with open(target, "w") as file:
+                file.write(content)
+            stat = os.stat(target)
+    finally:
+        # Only still present if the replace didn't happen
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+
+    return stat
+
+
+# Sentinel for keys absent from the current values (distinct from an explicit None)
+_MISSING = object()
+
+
+def _values_equal(a, b):
+    """Compare two YAML values, requiring the same type at every level (so True != 1 != 1.0)."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_values_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_values_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+# Serializes /update so concurrent writers can't interleave load-mutate-dump
+_write_lock = asyncio.Lock()
+
+
+# JSON Schema type for each primitive YAML type; looked up by exact type so
+# bools are not mistaken for ints. Anything else is treated as a string.
+_JSON_TYPES = {bool: "boolean", int: "integer", float: "number", str: "string"}
+
+# Shared {"type": ...} schemas for primitive array items, so building a schema
+# doesn't allocate one per array. Generated schemas are treated as read-only.
+_ITEM_SCHEMAS = {json_type: {"type": json_type} for json_type in _JSON_TYPES.values()}
+
+
+# Array indices like [0] in field paths, and camelCase word boundaries
+_ARRAY_INDEX_RE = re.compile(r'\[\d+\]')
+_CAMEL_CASE_RE = re.compile(r'([a-z])([A-Z])')
 
 
 def normalize_path(path):
     """Remove array indices like [0] from field paths for config lookup."""
-    return re.sub(r'\[\d+\]', '', path)
+    # Most paths have no indices, so skip the regex unless there's a bracket
+    if '[' not in path:
+        return path
+    return _ARRAY_INDEX_RE.sub('', path)
+
+
+def get_title_from_path(path):
+    """Generate a human-readable title from field path."""
+    # Only the last part of the path matters, and the same key names recur
+    # across sibling objects, so the conversion is cached on it
+    return _title_from_key(path.rsplit('.', 1)[-1])
+
+
+@functools.lru_cache(maxsize=2048)
+def _title_from_key(last_part):
+    """Convert camelCase or snake_case to Title Case."""
+    # Remove array indices
+    clean_part = _ARRAY_INDEX_RE.sub('', last_part)
+    # Add spaces before capitals and capitalize
+    spaced = _CAMEL_CASE_RE.sub(r'\1 \2', clean_part)
+    # Replace underscores with spaces
+    spaced = spaced.replace('_', ' ')
+    # Title case
+    return spaced.title()
 
 
 def create_json_schema(yaml_data):
@@ -123,166 +343,198 @@ def create_json_schema(yaml_data):
     if sections_config:
         schema["sections"] = sections_config
 
-    def is_readonly(path):
-        normalized = normalize_path(path)
-        return normalized in readonly_fields
-
-    def is_enum(path):
-        normalized = normalize_path(path)
-        return normalized in enum_fields
-
-    def get_description(path):
-        normalized = normalize_path(path)
-        return field_descriptions.get(normalized, None)
-
-    def get_title(path):
-        """Get title for a field - from config or auto-generated."""
-        normalized = normalize_path(path)
-        # Check if custom title is defined in config
-        if normalized in field_titles:
-            return field_titles[normalized]
-        # Otherwise auto-generate
-        return get_title_from_path(path)
-
-    def get_type_schema(value):
-        """Determine JSON Schema type for a primitive value."""
-        if isinstance(value, bool):
-            return {"type": "boolean"}
-        elif isinstance(value, int):
-            return {"type": "integer"}
-        elif isinstance(value, float):
-            return {"type": "number"}
-        else:
-            return {"type": "string"}
-
-    def get_title_from_path(path):
-        """Generate a human-readable title from field path."""
-        # Get the last part of the path
-        parts = path.split('.')
-        last_part = parts[-1]
-        # Convert camelCase or snake_case to Title Case
-        # Remove array indices
-        clean_part = re.sub(r'\[\d+\]', '', last_part)
-        # Add spaces before capitals and capitalize
-        spaced = re.sub(r'([a-z])([A-Z])', r'\1 \2', clean_part)
-        # Replace underscores with spaces
-        spaced = spaced.replace('_', ' ')
-        # Title case
-        return spaced.title()
-
-    def process_value(value, field_path):
-        """Process any value and return its schema."""
+    # Snapshot the config lookups as locals: faster than globals in the hot
+    # loop, and a concurrent reload can't change them halfway through a build
+    readonly = readonly_fields
+    enums = enum_fields
+    titles = field_titles
+    descriptions = field_descriptions
+
+    # Per-build memo of field path -> (readonly, enum, description, title)
+    path_meta = {}
+
+    def get_path_meta(path):
+        """Resolve config metadata for a field path, once per schema build."""
+        meta = path_meta.get(path)
+        if meta is None:
+            normalized = normalize_path(path)
+            # Title comes from config if defined, otherwise it's auto-generated
+            if normalized in titles:
+                title = titles[normalized]
+            else:
+                title = get_title_from_path(path)
+            meta = path_meta[path] = (
+                normalized in readonly,
+                normalized in enums,
+                descriptions.get(normalized, None),
+                title,
+            )
+        return meta
+
+    def process_value(value, field_path, pending):
+        """Return the schema for a value, queueing nested objects onto pending."""
+        _, is_enum, _, title = get_path_meta(field_path)
+
+        if not isinstance(value, (dict, list)):
+            # Primitive value
+            return {"type": _JSON_TYPES.get(type(value), "string"), "title": title}
+
         if isinstance(value, dict):
-            # Nested object
-            props = process_object(value, field_path)
+            # Nested object - its properties are filled in when popped off the stack
+            props = {}
+            pending.append((value, field_path + ".", props))
             schema_def = {
                 "type": "object",
                 "properties": props,
-                "title": get_title(field_path)
+                "title": title
             }
             return schema_def
 
-        elif isinstance(value, list):
+        else:
             # Array
             if not value:
                 return {
                     "type": "array",
-                    "items": {"type": "string"},
-                    "title": get_title(field_path)
+                    "items": _ITEM_SCHEMAS["string"],
+                    "title": title
                 }
 
             # Check if it's an enum field (list of primitives used as options)
-            if is_enum(field_path) and value and not isinstance(value[0], dict):
+            if is_enum and value and not isinstance(value[0], dict):
                 return {
                     "type": "array",
-                    "items": {"type": "string"},
+                    "items": _ITEM_SCHEMAS["string"],
                     "uniqueItems": True,
                     "default": value,
                     "enum_values": value,
-                    "title": get_title(field_path)
+                    "title": title
                 }
 
             # Regular array - infer schema from first item
             sample_item = value[0]
             if isinstance(sample_item, dict):
-                # Array of objects - process the structure
-                item_schema = process_value(sample_item, f"{field_path}[0]")
-                # Override the item title with custom one from config
-                item_title = get_title(f"{field_path}[0]")
+                # Array of objects - process the structure. The item path
+                # normalizes to the array's own path, so the item already
+                # carries the array's (custom or auto-generated) title.
+                item_schema = process_value(sample_item, field_path + "[0]", pending)
                 # If no custom title, try to make it singular
-                if item_title == get_title_from_path(f"{field_path}[0]"):
-                    auto_title = get_title(field_path).rstrip('s')  # Remove plural 's'
-                    if auto_title == get_title(field_path):
-                        auto_title = f"{auto_title} Item"
-                    item_title = auto_title
-                item_schema["title"] = item_title
+                if title == get_title_from_path(field_path):
+                    item_title = title.rstrip('s')  # Remove plural 's'
+                    if item_title == title:
+                        item_title = f"{item_title} Item"
+                    item_schema["title"] = item_title
 
                 return {
                     "type": "array",
                     "items": item_schema,
-                    "title": get_title(field_path)
+                    "title": title
                 }
             else:
                 # Array of primitives
-                item_type = get_type_schema(sample_item)
+                item_type = _ITEM_SCHEMAS[_JSON_TYPES.get(type(sample_item), "string")]
                 return {
                     "type": "array",
                     "items": item_type,
-                    "title": get_title(field_path)
+                    "title": title
                 }
-        else:
-            # Primitive value
-            schema_def = get_type_schema(value)
-            schema_def["title"] = get_title(field_path)
-            return schema_def
 
-    def process_object(obj, current_path=""):
-        """Process an object and return properties dict."""
-        properties = {}
+    def process_object(obj):
+        """Walk an object with an explicit stack and return its properties dict."""
+        root_properties = {}
+        # Each entry carries its path prefix ("" at the root, "parent." below it),
+        # so building a field path needs no root/nested branch
+        pending = [(obj, "", root_properties)]
+
+        while pending:
+            current, prefix, properties = pending.pop()
+
+            for key, value in current.items():
+                field_path = f"{prefix}{key}"
 
-        for key, value in obj.items():
-            field_path = f"{current_path}.{key}" if current_path else key
+                # Get the schema for this value
+                prop_schema = process_value(value, field_path, pending)
 
-            # Get the schema for this value
-            prop_schema = process_value(value, field_path)
+                is_readonly, _, description, _ = get_path_meta(field_path)
 
-            # Add read-only flag if configured
-            if is_readonly(field_path):
-                prop_schema["readOnly"] = True
+                # Add read-only flag if configured
+                if is_readonly:
+                    prop_schema["readOnly"] = True
 
-            # Add description if configured
-            description = get_description(field_path)
-            if description:
-                prop_schema["description"] = description
+                # Add description if configured
+                if description:
+                    prop_schema["description"] = description
 
-            properties[key] = prop_schema
+                properties[key] = prop_schema
 
-        return properties
+        return root_properties
 
     # Process the root object
     schema["properties"] = process_object(yaml_data)
     return schema
 
 
+def _load_schema():
+    """
+    Return the JSON Schema for values.yaml as serialized JSON bytes,
+    rebuilding it only when the file or config changes.
+    """
+    values = _load_values()
+
+    # Only use the cache if an update didn't replace the values in the meantime
+    entry = _yaml_cache.get(VALUES_FILE)
+    if entry is None or entry[2] is not values:
+        return _dumps_json(create_json_schema(values))
+
+    key = (entry[0], entry[1], _config_version)
+    with _schema_cache_lock:
+        schema = _schema_cache.get(key)
+    if schema is not None:
+        return schema
+
+    # Built outside the lock so a slow build doesn't block cache hits
+    schema = _dumps_json(create_json_schema(values))
+    with _schema_cache_lock:
+        _schema_cache[key] = schema
+        while len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+            _schema_cache.pop(next(iter(_schema_cache)))
+
+    return schema
+
+
+def _pull_if_stale():
+    """
+    Pull from Git unless a pull finished within the last _PULL_TTL seconds.
+    Concurrent callers wait on the lock and then reuse that pull.
+
+    Returns:
+        The pull result, or None if the last pull is still fresh
+    """
+    global _last_pull_ts
+
+    with _pull_lock:
+        if time.monotonic() - _last_pull_ts < _PULL_TTL:
+            return None
+        pull_result = git_helper.pull()
+        _last_pull_ts = time.monotonic()
+        return pull_result
+
+
 @app.get("/schema")
-def get_schema():
+async def get_schema():
     """Load values.yaml and convert it to JSON Schema format."""
     try:
-        # Pull latest changes from Git if enabled
+        # Pull latest changes from Git if enabled (at most once per _PULL_TTL)
         if git_helper.is_enabled():
-            pull_result = git_helper.pull()
-            if pull_result.get("success"):
-                logging.info(f"Pulled latest changes: {pull_result.get('message')}")
-            else:
-                logging.warning(f"Git pull warning: {pull_result.get('message')}")
-
-        with open(VALUES_FILE, "r") as file:
-            values = yaml.safe_load(file) or {}
-
-        # Create a proper JSON Schema
-        schema = create_json_schema(values)
+            pull_result = await run_in_threadpool(_pull_if_stale)
+            if pull_result is not None:
+                if pull_result.get("success"):
+                    logging.info(f"Pulled latest changes: {pull_result.get('message')}")
+                else:
+                    logging.warning(f"Git pull warning: {pull_result.get('message')}")
 
-        return schema
+        # Cached schemas are already serialized, so skip the response encoder
+        content = await run_in_threadpool(_load_schema)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         logging.error(f"Error loading schema: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -292,53 +544,75 @@ def get_schema():
 def get_config():
     """Return the current configuration."""
     try:
-        return config
+        return Response(content=_config_json, media_type="application/json")
     except Exception as e:
         logging.error(f"Error loading config: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/update")
-def update_values(data: Dict[str, Any]):
+async def update_values(data: Dict[str, Any]):
     """Update values.yaml with data from the form, only changing modified fields."""
-    try:
-        # Load current values
-        with open(VALUES_FILE, "r") as file:
-            current_values = yaml.safe_load(file) or {}
+    # Nothing that could be applied: skip loading, copying and writing entirely
+    if all(key in readonly_fields for key in data):
+        logging.info("Update contained no writable fields; leaving values file untouched")
+        return {"message": "No changes"}
+
+    async with _write_lock:
+        return await run_in_threadpool(_update_values, data)
 
-        # Helper function to check if a field should be protected
-        def is_protected_field(field_path):
-            """Check if a field is read-only or an enum field."""
-            return field_path in readonly_fields
 
-        # Helper function to update nested dictionaries
-        def update_nested_dict(current, updates, current_path=""):
+def _update_values(data: Dict[str, Any]):
+    """Apply an update to values.yaml; runs in the threadpool under _write_lock."""
+    try:
+        # Load current values (copied so the cached dict is untouched if the write fails)
+        current_values = copy.deepcopy(_load_values())
+
+        # Helper function to update nested dictionaries; returns True if anything changed.
+        # The config sets are bound as defaults so the recursion reads them as locals.
+        # prefix is the parent path plus a trailing "." ("" at the root).
+        def update_nested_dict(current, updates, prefix="", readonly=readonly_fields, enums=enum_fields):
+            changed = False
             for key, value in updates.items():
-                field_path = f"{current_path}.{key}" if current_path else key
+                # Field paths are only needed to check read-only fields
+                field_path = ""
+                if readonly:
+                    field_path = prefix + key
+
+                    # Skip read-only fields
+                    if field_path in readonly:
+                        logging.info(f"Skipping protected field: {field_path}")
+                        continue
 
-                # Skip read-only fields
-                if is_protected_field(field_path):
-                    logging.info(f"Skipping protected field: {field_path}")
-                    continue
+                current_value = current.get(key, _MISSING)
 
                 # If both current and updates have a dictionary at this key
-                if key in current and isinstance(current[key], dict) and isinstance(value, dict):
-                    update_nested_dict(current[key], value, field_path)
+                if isinstance(current_value, dict) and isinstance(value, dict):
+                    changed = update_nested_dict(current_value, value, field_path + ".") or changed
                 # Skip enum fields if they're in the list (preserve the enum list itself)
-                elif key in enum_fields and isinstance(current.get(key), list):
+                elif key in enums and isinstance(current_value, list):
                     # Keep the original list, don't update
                     logging.info(f"Skipping enum field: {key}")
                     pass
-                else:
-                    # For all other cases, update the value
+                elif not _values_equal(current_value, value):
+                    # For all other cases, update the value if it actually differs
                     current[key] = value
+                    changed = True
+            return changed
 
-        # Apply updates selectively
-        update_nested_dict(current_values, data)
+        # Apply updates selectively, skipping the write entirely if nothing changed
+        if not update_nested_dict(current_values, data):
+            logging.info("Update contained no changes; leaving values file untouched")
+            return {"message": "No changes"}
 
-        # Save the updated values to YAML
-        with open(VALUES_FILE, "w") as file:
-            yaml.dump(current_values, file, default_flow_style=False, sort_keys=False)
+        # Save the updated values to YAML: emit to a string in one pass, write it
+        # with a single call, and swap the file in atomically so concurrent
+        # readers never see a partial write
+        content = yaml.dump(current_values, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+        stat = _write_values_file(content)
+
+        # Warm the cache with what we just wrote instead of re-parsing on the next read
+        _store_yaml_cached(VALUES_FILE, stat, current_values)
 
         # Commit and push to Git if enabled
         git_result = None
@@ -359,13 +633,34 @@ def update_values(data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def to_columnar(values):
+    """
+    Return a copy of values where each top-level list of objects that all share
+    the same keys is sent once as {"__keys__": [...], "__rows__": [[...], ...]}
+    instead of repeating the keys for every item.
+    """
+    result = {}
+    for key, value in values.items():
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            item_keys = list(value[0])
+            if all(isinstance(item, dict) and list(item) == item_keys for item in value):
+                result[key] = {
+                    "__keys__": item_keys,
+                    "__rows__": [list(item.values()) for item in value],
+                }
+                continue
+        result[key] = value
+    return result
+
+
 @app.get("/values")
-def get_values():
+async def get_values(columnar: bool = False):
     """Return the current values from the YAML file."""
     try:
-        with open(VALUES_FILE, "r") as file:
-            values = yaml.safe_load(file) or {}
-        return values
+        values = await run_in_threadpool(_load_values)
+        if columnar:
+            values = to_columnar(values)
+        return Response(content=_dumps_json(values), media_type="application/json")
     except Exception as e:
         logging.error(f"Error loading values: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -375,15 +670,12 @@ def get_values():
 def reload_config():
     """Reload configuration from config.yaml."""
     try:
-        global config, readonly_fields, enum_fields, field_titles, field_descriptions, sections_config, ui_config
+        global _config_version
+
+        apply_config(load_config())
 
-        config = load_config()
-        readonly_fields = config.get("readonly_fields", [])
-        enum_fields = config.get("enum_fields", [])
-        field_titles = config.get("field_titles", {})
-        field_descriptions = config.get("field_descriptions", {})
-        sections_config = config.get("sections", [])
-        ui_config = config.get("ui_config", {})
+        # Schema metadata depends on the config, so retire the cached schemas
+        _config_version += 1
 
         return {"message": "Configuration reloaded successfully", "config": config}
     except Exception as e:
@@ -435,6 +727,22 @@ def git_push(message: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Exercise the YAML loader once at import so the first request doesn't pay
+# for any lazy LibYAML setup
+try:
+    yaml.load("", Loader=_Loader)
+except Exception:
+    pass
+
+
+def _warm_caches():
+    """Parse values.yaml and build its schema so the first request hits the cache."""
+    try:
+        _load_schema()
+    except Exception as e:
+        logging.warning(f"Could not pre-load values file: {str(e)}")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file